@@ -1,39 +1,406 @@
 #!/usr/bin/env python3
 import requests
+import calendar
 import csv
+import heapq
+import itertools
 import os
 import json
 import logging
+import re
+import sqlite3
 import sys
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from collections import Counter
-from typing import List, Dict, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import attrgetter
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Optional, Any, Iterable, Iterator, NamedTuple, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # Optional: faster parsing and serialization of large payloads
+    orjson = None
+
+json_loads = orjson.loads if orjson else json.loads
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize obj to compact JSON text, with orjson when available."""
+    if orjson:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
 
 
 class GitHubAPIError(Exception):
     """Custom exception for GitHub API errors."""
-    pass
+    
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class RepoMeta(NamedTuple):
+    """Repository details shared by every job row of that repository."""
+    branch: Optional[str]
+    size: int
+    language: Optional[str]
+    visibility: str
+
+
+UNKNOWN_REPO_META = RepoMeta(branch=None, size=0, language='unknown', visibility='unknown')
+
+
+# Durations repeat heavily across jobs, so their text is formatted once per value
+@lru_cache(maxsize=4096)
+def _format_duration(seconds: Optional[int]) -> str:
+    """Format a duration in seconds as "MM:SS", or "unknown" if it is not known."""
+    if seconds is None:
+        return "unknown"
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+class JobRow(NamedTuple):
+    """Usage record for a single workflow job (repository details live in RepoMeta)."""
+    repo: str
+    workflow_file: str
+    workflow_name: str
+    runner_labels: str
+    runner_type: str
+    cost_category: str
+    job_name: str
+    job_status: str
+    run_date: Optional[str]
+    completed_date: Optional[str]
+    duration_seconds: Optional[int]
+    run_id: int
+    job_id: Union[int, str]
+    conclusion: Optional[str]
+    html_url: str
+    
+    @property
+    def duration(self) -> str:
+        """Duration formatted for display as "MM:SS" (or "unknown")."""
+        return _format_duration(self.duration_seconds)
+
+
+# Position of the raw duration, which reports replace with its formatted value
+_DURATION_INDEX = JobRow._fields.index('duration_seconds')
+
+
+class GroupRow(NamedTuple):
+    """Summary statistics for a group of jobs."""
+    group: str
+    group_type: str
+    total_jobs: int
+    successful_jobs: int
+    failed_jobs: int
+    success_rate: str
+    average_duration_seconds: Optional[int]
+    sample_repository: str
+    
+    @property
+    def average_duration(self) -> str:
+        """Average job duration formatted for display as "MM:SS" (or "unknown")."""
+        return _format_duration(self.average_duration_seconds)
+
+
+# Position of the raw average duration, which reports replace with its formatted value
+_AVERAGE_DURATION_INDEX = GroupRow._fields.index('average_duration_seconds')
+
+
+class ReportStats(NamedTuple):
+    """Aggregate figures shared by the HTML report and the GitHub summary."""
+    total_jobs: int
+    unique_repos: int
+    unique_workflows: int
+    repo_counts: Counter
+    status_counts: Counter
+    label_counts: Counter
+    is_grouped: bool
+
+
+# CSV column titles for job rows joined with their repository details
+JOB_CSV_HEADERS = (
+    'Org', 'Repo', 'Branch', 'Workflow File', 'Workflow Name', 'Runner Labels',
+    'Runner Type', 'Cost Category', 'Job Name', 'Job Status', 'Run Date',
+    'Completed Date', 'Duration', 'Run ID', 'Job ID', 'Conclusion', 'HTML URL',
+    'Repository Size', 'Repository Language', 'Repository Visibility'
+)
+
+# CSV column titles for group rows, in field order
+GROUP_CSV_HEADERS = (
+    'Group', 'Group Type', 'Total Jobs', 'Successful Jobs', 'Failed Jobs',
+    'Success Rate', 'Average Duration', 'Sample Repository'
+)
+
+
+class _GroupTotals:
+    """Running totals for one group while grouping job rows."""
+    __slots__ = ('total_jobs', 'successful_jobs', 'failed_jobs',
+                 'duration_seconds', 'timed_jobs', 'sample_repository')
+    
+    def __init__(self, sample_repository: str):
+        self.total_jobs = 0
+        self.successful_jobs = 0
+        self.failed_jobs = 0
+        self.duration_seconds = 0
+        self.timed_jobs = 0
+        self.sample_repository = sample_repository
+
+
+# JobRow field used for each GROUP_BY option ("branch" comes from RepoMeta)
+GROUP_BY_FIELDS = {
+    'repo': 'repo',
+    'label': 'runner_labels',
+    'status': 'job_status',
+    'workflow': 'workflow_name',
+    'runner_type': 'runner_type',
+    'cost_category': 'cost_category'
+}
+
+
+def _iso_to_epoch(timestamp: str) -> int:
+    """Convert a GitHub API timestamp ("YYYY-MM-DDTHH:MM:SSZ") to Unix seconds."""
+    if len(timestamp) == 20 and timestamp[19] == 'Z':
+        # Fixed-width UTC format: slice the fields instead of parsing
+        return calendar.timegm((
+            int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+            int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19]), 0, 0, 0
+        ))
+    return int(datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp())
+
+
+# Characters GitHub allows in a repository name
+REPO_NAME_PATTERN = re.compile(r'[A-Za-z0-9._-]+')
+
+# REPO_FILTER prefix that selects a single repository by its exact name
+EXACT_REPO_PREFIX = '='
+
+
+# Only the repository fields the analysis reads; the REST listing returns ~100.
+REPOSITORIES_QUERY = """
+query($org: String!, $cursor: String) {
+  organization(login: $org) {
+    repositories(first: 100, after: $cursor, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        defaultBranchRef { name }
+        primaryLanguage { name }
+        diskUsage
+        visibility
+      }
+    }
+  }
+}
+"""
+
+
+class ResponseCache:
+    """
+    Disk-backed store of GitHub API responses for conditional requests.
+    
+    Database errors while reading or writing are logged and treated as a
+    cache miss or a skipped write, so a damaged cache never fails an analysis.
+    """
+    
+    # Bump when the stored layout changes; caches written by other versions are discarded
+    SCHEMA_VERSION = 2
+    
+    def __init__(self, path: str, max_age_days: int = 7):
+        """
+        Open (or create) the cache database and prune stale entries.
+        
+        Args:
+            path: SQLite database file path
+            max_age_days: Entries not used for this many days are deleted
+        """
+        self.path = path
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        # Autocommit mode: every statement is its own transaction
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        # Losing the cache only costs a cold run, so skip fsync on every write
+        self._conn.execute("PRAGMA synchronous = OFF")
+        
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS responses")
+            self._conn.execute("DROP TABLE IF EXISTS run_labels")
+            self._conn.execute("DROP TABLE IF EXISTS run_jobs")
+            self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        
+        # Conditional (ETag) responses of listing endpoints, keyed by URL
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, etag TEXT, "
+            "body BLOB NOT NULL, next_url TEXT, used_at REAL NOT NULL)"
+        )
+        # Projected jobs and the runner labels they used, per completed run attempt
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS run_jobs (run_id INTEGER, attempt INTEGER, "
+            "jobs TEXT NOT NULL, labels TEXT NOT NULL, used_at REAL NOT NULL, "
+            "PRIMARY KEY (run_id, attempt))"
+        )
+        self.prune(max_age_days)
+    
+    def prune(self, max_age_days: int) -> None:
+        """
+        Delete entries that have not been read or written for max_age_days.
+        
+        Run listings are keyed by a URL containing the start date and completed
+        runs age out of the analysis window, so unused entries never come back.
+        """
+        cutoff = time.time() - max_age_days * 86400
+        with self._lock:
+            deleted = sum(
+                self._conn.execute(f"DELETE FROM {table} WHERE used_at < ?", (cutoff,)).rowcount
+                for table in ('responses', 'run_jobs')
+            )
+            if deleted:
+                # Give the space back so the stored cache does not keep growing
+                self._conn.execute("VACUUM")
+    
+    def get(self, key: str) -> Optional[Tuple[Optional[str], bytes, Optional[str]]]:
+        """Return the cached (etag, body, next_url) triple for key, if any."""
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT etag, body, next_url FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row:
+                    self._conn.execute("UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key))
+            except sqlite3.Error as e:
+                self.logger.warning(f"Failed to read cached response for {key}: {e}")
+                return None
+            return row
+    
+    def set(self, key: str, etag: Optional[str], body: bytes,
+            next_url: Optional[str] = None) -> None:
+        """Store the response body, its ETag and its next page link under key."""
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, etag, body, next_url, used_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, etag, body, next_url, time.time())
+                )
+            except sqlite3.Error as e:
+                self.logger.warning(f"Failed to cache response for {key}: {e}")
+    
+    def _get_run_column(self, column: str, run_id: int, attempt: int) -> Optional[str]:
+        """Read one column of a completed run attempt's entry and mark it as used."""
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    f"SELECT {column} FROM run_jobs WHERE run_id = ? AND attempt = ?", (run_id, attempt)
+                ).fetchone()
+                if row:
+                    self._conn.execute(
+                        "UPDATE run_jobs SET used_at = ? WHERE run_id = ? AND attempt = ?",
+                        (time.time(), run_id, attempt)
+                    )
+            except sqlite3.Error as e:
+                self.logger.warning(f"Failed to read cached jobs of run {run_id}: {e}")
+                return None
+        return row[0] if row else None
+    
+    def get_run_jobs(self, run_id: int, attempt: int) -> Optional[str]:
+        """Return the JSON-encoded projected jobs of a completed run attempt, if cached."""
+        return self._get_run_column('jobs', run_id, attempt)
+    
+    def get_run_labels(self, run_id: int, attempt: int) -> Optional[frozenset]:
+        """Return the runner labels used by the jobs of a completed run attempt, if known."""
+        labels = self._get_run_column('labels', run_id, attempt)
+        if labels is None:
+            return None
+        try:
+            return frozenset(json.loads(labels))
+        except (ValueError, TypeError):
+            return None
+    
+    def set_run_jobs(self, run_id: int, attempt: int, jobs: str, labels: Iterable[str]) -> None:
+        """Store the JSON-encoded projected jobs of a completed run attempt and their labels."""
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO run_jobs (run_id, attempt, jobs, labels, used_at) VALUES (?, ?, ?, ?, ?)",
+                    (run_id, attempt, jobs, json.dumps(sorted(labels)), time.time())
+                )
+            except sqlite3.Error as e:
+                self.logger.warning(f"Failed to cache jobs of run {run_id}: {e}")
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            try:
+                self._conn.close()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Failed to close API response cache: {e}")
 
 
 class RunnerUsageAnalyzer:
     """Analyzes GitHub Actions runner usage across an organization."""
     
-    def __init__(self, github_token: str, org_name: str):
+    # Label fragments used to categorize runners (matched case-insensitively)
+    GITHUB_HOSTED_LABELS = ('ubuntu-latest', 'windows-latest', 'macos-latest')
+    LARGE_RUNNER_MARKERS = ('large', 'xl', 'xxl', '4-core', '8-core', '16-core')
+    
+    # Retries for requests rejected by a primary or secondary rate limit
+    MAX_RATE_LIMIT_RETRIES = 3
+    
+    def __init__(self, github_token: str, org_name: str, max_concurrency: int = 16,
+                 cache_path: Optional[str] = None, cache_max_age_days: int = 7):
         """
         Initialize the analyzer with GitHub credentials.
         
         Args:
             github_token: GitHub personal access token or GITHUB_TOKEN
             org_name: GitHub organization name
+            max_concurrency: Maximum number of API requests in flight at once
+            cache_path: Optional SQLite file used to cache API responses between runs
+            cache_max_age_days: Cache entries unused for this many days are pruned
         """
         self.github_token = github_token
         self.org_name = org_name
+        self.max_concurrency = max(1, max_concurrency)
+        self._runner_categories: Dict[Tuple[str, ...], Tuple[str, str]] = {}
+        # Repository details for analyzed repositories, keyed by repository name
+        self.repo_meta: Dict[str, RepoMeta] = {}
+        # Last known (remaining, reset timestamp) per rate limit resource
+        self._rate_limits: Dict[str, Tuple[int, float]] = {}
+        self._rate_limit_lock = threading.Lock()
+        # Held while pausing for a resource to reset, so only its requests wait
+        self._rate_limit_pause_locks = {resource: threading.Lock() for resource in ('core', 'graphql')}
         self.headers = {
             "Authorization": f"token {github_token}",
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "GitHub-Runner-Analytics/1.0"
         }
+        
+        # One pooled session shared by all worker threads, sized so that every
+        # concurrent request can reuse a kept-alive connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=self.max_concurrency, pool_maxsize=self.max_concurrency)
+        self.session.mount("https://", adapter)
         self.setup_logging()
+        
+        self.cache = None
+        if cache_path:
+            try:
+                self.cache = ResponseCache(cache_path, cache_max_age_days)
+                self.logger.info(f"Using API response cache: {cache_path}")
+            except sqlite3.Error as e:
+                self.logger.warning(f"API response cache disabled, failed to open {cache_path}: {e}")
+    
+    def close(self) -> None:
+        """Close the response cache and the HTTP session."""
+        if self.cache:
+            self.cache.close()
+            self.cache = None
+        self.session.close()
     
     def setup_logging(self) -> None:
         """Configure logging for the application."""
@@ -44,75 +411,316 @@ class RunnerUsageAnalyzer:
         )
         self.logger = logging.getLogger(__name__)
     
-    def make_api_request(self, url: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+    @staticmethod
+    def _rate_limit_resource(url: str) -> str:
+        """Return the GitHub rate limit bucket that a request URL draws from."""
+        if url.endswith('/graphql'):
+            return 'graphql'
+        return 'core'
+    
+    def _wait_for_rate_limit(self, resource: str) -> None:
+        """
+        Reserve a request against the known rate limit, pausing until the
+        limit resets when too few requests remain for the workers in flight.
+        
+        Args:
+            resource: Rate limit bucket (core, graphql)
+        """
+        # Other workers drawing from the same resource queue behind a pause;
+        # the shared state lock is never held while sleeping
+        with self._rate_limit_pause_locks[resource]:
+            with self._rate_limit_lock:
+                if resource not in self._rate_limits:
+                    return
+                remaining, reset_at = self._rate_limits[resource]
+                
+                if remaining > max(self.max_concurrency, 10):
+                    self._rate_limits[resource] = (remaining - 1, reset_at)
+                    return
+            
+            delay = reset_at - time.time() + 1
+            if delay > 0:
+                self.logger.warning(
+                    f"Rate limit nearly exhausted ({remaining} {resource} requests remaining), "
+                    f"pausing {delay:.0f}s until it resets"
+                )
+                time.sleep(delay)
+            with self._rate_limit_lock:
+                self._rate_limits.pop(resource, None)
+    
+    def _update_rate_limit(self, resource: str, response: requests.Response) -> None:
+        """Record the rate limit state reported in a response's headers."""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset_at = response.headers.get('X-RateLimit-Reset')
+        if remaining is None or reset_at is None:
+            return
+        
+        with self._rate_limit_lock:
+            self._rate_limits[resource] = (int(remaining), float(reset_at))
+        
+        if resource == 'core' and int(remaining) < 100:
+            self.logger.warning(f"Rate limit running low: {remaining} requests remaining")
+    
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a request through the shared session, pacing it against GitHub's
+        rate limits and retrying when a rate limit rejects it.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Additional arguments for requests.Session.request
+            
+        Returns:
+            The response of the last attempt
+        """
+        resource = self._rate_limit_resource(url)
+        
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            self._wait_for_rate_limit(resource)
+            response = self.session.request(method, url, timeout=30, **kwargs)
+            self._update_rate_limit(resource, response)
+            
+            if response.status_code not in (403, 429) or attempt == self.MAX_RATE_LIMIT_RETRIES:
+                return response
+            
+            # Secondary rate limits send Retry-After; an exhausted primary limit
+            # reports zero remaining. Any other 403 is a real permission error.
+            if 'Retry-After' in response.headers:
+                delay = float(response.headers['Retry-After'])
+            elif response.headers.get('X-RateLimit-Remaining') == '0':
+                delay = float(response.headers.get('X-RateLimit-Reset', time.time())) - time.time() + 1
+            else:
+                return response
+            
+            self.logger.warning(f"Rate limited by GitHub, retrying in {max(delay, 0):.0f}s")
+            time.sleep(max(delay, 0))
+        
+        return response
+    
+    def _decode_json(self, content: bytes, url: str, status_code: Optional[int] = None) -> Any:
+        """
+        Decode a JSON response body.
+        
+        Args:
+            content: Raw response body
+            url: URL the body was returned for (used in error messages)
+            status_code: HTTP status code of the response
+            
+        Returns:
+            The decoded JSON data
+            
+        Raises:
+            GitHubAPIError: If the body is not valid JSON
+        """
+        try:
+            return json_loads(content)
+        except ValueError as e:
+            self.logger.error(f"Invalid JSON in response from {url}: {e}")
+            raise GitHubAPIError(f"Invalid JSON in response from {url}: {e}", status_code)
+    
+    def make_api_request(self, url: str, params: Optional[Dict] = None,
+                         conditional: bool = True) -> Tuple[Any, Optional[str]]:
         """
         Make a request to the GitHub API with error handling.
         
+        When a response cache is configured, requests are sent with the cached
+        ETag and a 304 Not Modified reply (which does not count against the
+        rate limit) is answered from the cache.
+        
         Args:
             url: API endpoint URL
             params: Optional query parameters
+            conditional: Whether to revalidate the response against the cache;
+                disable for responses that are cached in another form
             
         Returns:
-            JSON response data
+            Tuple of the JSON response data and the URL of the next page
+            (from the Link header), or None on the last page
             
         Raises:
             GitHubAPIError: If the API request fails
         """
+        use_cache = conditional and self.cache is not None
+        cache_key = requests.Request('GET', url, params=params).prepare().url if use_cache else None
+        cached = self.cache.get(cache_key) if use_cache else None
+        
+        headers = {"If-None-Match": cached[0]} if cached and cached[0] else None
+        
         try:
             self.logger.debug(f"Making API request to: {url}")
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = self._send('GET', url, headers=headers, params=params)
             response.raise_for_status()
             
-            # Check rate limit
-            remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
-            if remaining < 100:
-                self.logger.warning(f"Rate limit running low: {remaining} requests remaining")
+            if response.status_code == 304 and cached:
+                self.logger.debug(f"Not modified, using cached response for: {url}")
+                return self._decode_json(cached[1], url, response.status_code), cached[2]
+            
+            data = self._decode_json(response.content, url, response.status_code)
+            next_url = response.links.get('next', {}).get('url')
+            etag = response.headers.get('ETag')
+            if use_cache and etag:
+                self.cache.set(cache_key, etag, response.content, next_url)
+            
+            return data, next_url
+        except requests.exceptions.RequestException as e:
+            status_code = e.response.status_code if e.response is not None else None
+            # A missing resource is not necessarily an error; callers decide
+            log = self.logger.debug if status_code == 404 else self.logger.error
+            log(f"API request failed for {url}: {e}")
+            raise GitHubAPIError(f"GitHub API request failed: {e}", status_code)
+    
+    def iter_pages(self, url: str, params: Optional[Dict] = None,
+                   conditional: bool = True) -> Iterator[Any]:
+        """
+        Yield each page of a paginated REST endpoint by following its
+        Link rel="next" header until no further page is advertised.
+        
+        Args:
+            url: API endpoint URL of the first page
+            params: Optional query parameters (carried by the next links afterwards)
+            conditional: Whether to revalidate each page against the cache
+            
+        Yields:
+            JSON response data of each page
+        """
+        while url:
+            data, url = self.make_api_request(url, params, conditional)
+            params = None
+            yield data
+    
+    def graphql_request(self, query: str, variables: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Make a request to the GitHub GraphQL API with error handling.
+        
+        Args:
+            query: GraphQL query document
+            variables: Optional query variables
+            
+        Returns:
+            The "data" member of the GraphQL response
             
-            return response.json()
+        Raises:
+            GitHubAPIError: If the request fails or the response carries errors
+        """
+        try:
+            self.logger.debug("Making GraphQL request")
+            response = self._send(
+                'POST',
+                "https://api.github.com/graphql",
+                json={"query": query, "variables": variables or {}}
+            )
+            response.raise_for_status()
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"API request failed for {url}: {e}")
-            raise GitHubAPIError(f"GitHub API request failed: {e}")
+            self.logger.error(f"GraphQL request failed: {e}")
+            raise GitHubAPIError(f"GitHub GraphQL request failed: {e}")
+        
+        payload = self._decode_json(response.content, response.url, response.status_code)
+        
+        if payload.get('errors'):
+            messages = '; '.join(error.get('message', str(error)) for error in payload['errors'])
+            self.logger.error(f"GraphQL query returned errors: {messages}")
+            raise GitHubAPIError(f"GitHub GraphQL query failed: {messages}")
+        
+        return payload.get('data') or {}
     
     def get_repositories(self) -> List[Dict[str, Any]]:
         """
         Fetch all repositories in the organization.
         
+        Uses GraphQL so that only the handful of fields the analysis needs are
+        transferred, instead of the full REST repository payload.
+        
         Returns:
-            List of repository data dictionaries
+            List of repository data dictionaries (REST-style keys)
         """
         self.logger.info(f"Fetching repositories for organization: {self.org_name}")
         repos = []
-        page = 1
+        cursor = None
         
         while True:
-            url = f"https://api.github.com/orgs/{self.org_name}/repos"
-            params = {"page": page, "per_page": 100, "sort": "updated", "direction": "desc"}
+            data = self.graphql_request(REPOSITORIES_QUERY, {"org": self.org_name, "cursor": cursor})
+            organization = data.get('organization')
+            if not organization:
+                raise GitHubAPIError(f"Organization not found: {self.org_name}")
             
-            data = self.make_api_request(url, params)
-            if not data:
-                break
-                
-            repos.extend(data)
-            self.logger.debug(f"Fetched page {page} with {len(data)} repositories")
-            page += 1
+            connection = organization['repositories']
+            repos.extend(self._normalize_graphql_repo(node) for node in connection['nodes'] if node)
+            self.logger.debug(f"Fetched {len(repos)} repositories so far")
             
-            # Prevent infinite loops
-            if page > 100:  # Max 10,000 repos
-                self.logger.warning("Reached maximum page limit for repositories")
+            if not connection['pageInfo']['hasNextPage']:
                 break
+            cursor = connection['pageInfo']['endCursor']
         
         self.logger.info(f"Found {len(repos)} repositories")
         return repos
     
+    def get_repository(self, repo_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a single repository in the organization by its exact name.
+        
+        Args:
+            repo_name: Repository name
+            
+        Returns:
+            Repository data dictionary, or None if no such repository exists
+        """
+        url = f"https://api.github.com/repos/{self.org_name}/{repo_name}"
+        try:
+            return self.make_api_request(url)[0]
+        except GitHubAPIError as e:
+            if e.status_code == 404:
+                return None
+            raise
+    
+    def find_repositories(self, pattern: str) -> List[Dict[str, Any]]:
+        """
+        Find organization repositories whose name contains a pattern (case-insensitive).
+        
+        The repository search API is not used: it matches whole name tokens
+        rather than substrings and leaves out forks, so the trimmed repository
+        listing is filtered instead.
+        
+        Args:
+            pattern: Repository name pattern
+            
+        Returns:
+            List of repository data dictionaries
+        """
+        pattern_lower = pattern.lower()
+        repos = [repo for repo in self.get_repositories() if pattern_lower in repo['name'].lower()]
+        self.logger.info(f"Found {len(repos)} repositories matching '{pattern}'")
+        return repos
+    
+    @staticmethod
+    def _normalize_graphql_repo(node: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a GraphQL repository node onto the REST field names used elsewhere."""
+        default_branch = node.get('defaultBranchRef') or {}
+        language = node.get('primaryLanguage') or {}
+        return {
+            'name': node['name'],
+            'default_branch': default_branch.get('name'),
+            'language': language.get('name'),
+            'size': node.get('diskUsage') or 0,
+            'visibility': (node.get('visibility') or 'unknown').lower()
+        }
+    
     def get_workflow_runs(self, repo_name: str, branch: Optional[str] = None, 
-                         days_back: int = 30) -> List[Dict[str, Any]]:
+                         days_back: int = 30, event: Optional[str] = None,
+                         actor: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get workflow runs for a repository within a time range.
         
+        All filters are applied server-side by the GitHub API. The job status
+        filter is not among them: a run's status or conclusion does not tell
+        which statuses its jobs have.
+        
         Args:
             repo_name: Repository name
             branch: Optional branch filter
             days_back: Number of days to look back for runs
+            event: Optional triggering event filter (push, pull_request, etc.)
+            actor: Optional filter for the user who triggered the run
             
         Returns:
             List of workflow run data
@@ -122,45 +730,180 @@ class RunnerUsageAnalyzer:
         
         if branch:
             params["branch"] = branch
+        if event:
+            params["event"] = event
+        if actor:
+            params["actor"] = actor
             
-        # Filter by date
-        since_date = (datetime.now() - timedelta(days=days_back)).isoformat()
-        params["created"] = f">={since_date}"
+        # Filter by date. GitHub reads the date as UTC; requesting whole days keeps
+        # the URL, and its cached ETag, stable across runs, and the runs created
+        # before the exact cutoff are dropped below.
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
+        params["created"] = f">={cutoff.date().isoformat()}"
+        cutoff_epoch = int(cutoff.timestamp())
         
         try:
-            data = self.make_api_request(url, params)
-            workflow_runs = data.get('workflow_runs', [])
+            workflow_runs = []
+            for data in self.iter_pages(url, params):
+                workflow_runs.extend(
+                    run for run in data.get('workflow_runs', [])
+                    if not run.get('created_at') or _iso_to_epoch(run['created_at']) >= cutoff_epoch
+                )
             self.logger.debug(f"Found {len(workflow_runs)} workflow runs for {repo_name}")
             return workflow_runs
         except GitHubAPIError as e:
             self.logger.error(f"Failed to fetch workflow runs for {repo_name}: {e}")
             return []
     
-    def get_jobs_for_run(self, repo_name: str, run_id: int) -> List[Dict[str, Any]]:
+    def get_jobs_for_run(self, repo_name: str, run_id: int,
+                         completed_attempt: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get jobs for a specific workflow run.
         
         Args:
             repo_name: Repository name
             run_id: Workflow run ID
+            completed_attempt: Attempt number if the run has completed. Jobs of a
+                completed attempt never change, so their projection is cached and
+                never re-fetched.
             
         Returns:
             List of job data
         """
-        url = f"https://api.github.com/repos/{self.org_name}/{repo_name}/actions/runs/{run_id}/jobs"
+        cache = self.cache if completed_attempt else None
+        if cache:
+            cached_jobs = cache.get_run_jobs(run_id, completed_attempt)
+            if cached_jobs is not None:
+                try:
+                    return json_loads(cached_jobs)
+                except ValueError:
+                    # A corrupt entry is treated as a miss and overwritten below
+                    self.logger.debug(f"Ignoring unreadable cached jobs for run {run_id}")
+        
+        url = f"https://api.github.com/repos/{self.org_name}/{repo_name}/actions/runs/{run_id}"
+        # The plain jobs endpoint returns the latest attempt, which may be a re-run
+        # started after the run was listed; pin the attempt whose jobs get cached
+        url += f"/attempts/{completed_attempt}/jobs" if completed_attempt else "/jobs"
         
         try:
-            data = self.make_api_request(url)
-            return data.get('jobs', [])
+            # Keep only the fields the analysis reads so the full payload can be freed.
+            # Job pages are not revalidated: completed attempts are cached projected
+            # below, and in-progress runs change between analyses anyway.
+            jobs = [
+                self._project_job(job)
+                for data in self.iter_pages(url, {"per_page": 100}, conditional=False)
+                for job in data.get('jobs', [])
+            ]
         except GitHubAPIError as e:
             self.logger.error(f"Failed to fetch jobs for run {run_id} in {repo_name}: {e}")
             return []
-
+        
+        # The labels are kept alongside so label-filtered analyses can skip the run later
+        if cache:
+            cache.set_run_jobs(
+                run_id, completed_attempt, json_dumps(jobs), {label for job in jobs for label in job['labels']}
+            )
+        return jobs
+    
+    def _can_skip_run(self, run: Dict[str, Any], target_label: Optional[str],
+                      skip_conclusions: frozenset) -> bool:
+        """
+        Check whether a workflow run cannot contribute any rows, so its jobs
+        need not be fetched.
+        
+        Args:
+            run: Workflow run data
+            target_label: Optional runner label being filtered for
+            skip_conclusions: Run conclusions whose jobs are not of interest
+            
+        Returns:
+            True if the run's jobs can be skipped
+        """
+        if run.get('conclusion') in skip_conclusions:
+            return True
+        
+        attempt = self._completed_attempt(run)
+        if not (target_label and attempt and self.cache):
+            return False
+        labels = self.cache.get_run_labels(run['id'], attempt)
+        return labels is not None and target_label not in labels
+    
+    @staticmethod
+    def _project_job(job: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a job payload (which includes every step) to the fields used for reporting."""
+        return {
+            'id': job.get('id', ''),
+            'name': job['name'],
+            'labels': job.get('labels', []),
+            'status': job.get('status', 'unknown'),
+            'conclusion': job.get('conclusion', 'unknown'),
+            'started_at': job.get('started_at', ''),
+            'completed_at': job.get('completed_at', ''),
+            'html_url': job.get('html_url', '')
+        }
+    
+    def _iter_run_jobs(self, repos: List[Dict[str, Any]], days_back: int,
+                       event: Optional[str], actor: Optional[str], target_label: Optional[str] = None,
+                       skip_conclusions: frozenset = frozenset()
+                       ) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Fetch workflow runs and their jobs concurrently on a bounded thread pool.
+        
+        Job requests for a repository are queued as soon as its runs arrive, so
+        both stages overlap. Results are yielded in repository/run order as
+        they complete, which keeps the report output deterministic. Runs that
+        cannot contain matching jobs are dropped without fetching their jobs.
+        
+        Args:
+            repos: Repositories to analyze
+            days_back: Number of days to look back for runs
+            event: Optional triggering event filter
+            actor: Optional filter for the user who triggered the run
+            target_label: Optional runner label being filtered for
+            skip_conclusions: Run conclusions whose jobs are not fetched
+            
+        Yields:
+            Tuples of (repository, workflow run, jobs)
+        """
+        self.logger.info(f"Fetching workflow runs and jobs for {len(repos)} repositories")
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            run_futures = {
+                executor.submit(self.get_workflow_runs, repo['name'], repo['default_branch'],
+                                days_back, event, actor): idx
+                for idx, repo in enumerate(repos)
+            }
+            
+            jobs_futures: List[List[Tuple[Dict[str, Any], Any]]] = [[] for _ in repos]
+            skipped_runs = 0
+            for future in as_completed(run_futures):
+                idx = run_futures[future]
+                repo_name = repos[idx]['name']
+                for run in future.result():
+                    if self._can_skip_run(run, target_label, skip_conclusions):
+                        skipped_runs += 1
+                        continue
+                    jobs_futures[idx].append((run, executor.submit(
+                        self.get_jobs_for_run, repo_name, run['id'], self._completed_attempt(run)
+                    )))
+            
+            total_runs = sum(len(runs) for runs in jobs_futures)
+            self.logger.info(f"Fetching jobs for {total_runs} workflow runs ({skipped_runs} skipped)")
+            
+            for idx, repo in enumerate(repos):
+                # Release each repository's futures once consumed
+                repo_jobs, jobs_futures[idx] = jobs_futures[idx], []
+                for run, future in repo_jobs:
+                    yield repo, run, future.result()
+    
     def analyze_runner_usage(self, target_label: Optional[str] = None, 
                             days_back: int = 30,
                             group_by: str = "repo",
                             status_filter: Optional[str] = None,
-                            repo_filter: Optional[str] = None) -> List[Dict[str, Any]]:
+                            repo_filter: Optional[str] = None,
+                            event_filter: Optional[str] = None,
+                            actor_filter: Optional[str] = None,
+                            skip_conclusions: Optional[Iterable[str]] = None) -> Union[List[JobRow], List[GroupRow]]:
         """
         Analyze runner usage across the organization.
         
@@ -169,11 +912,61 @@ class RunnerUsageAnalyzer:
             days_back: Number of days to look back for analysis
             group_by: Field to group results by (repo, label, status, workflow, branch)
             status_filter: Optional status filter (completed, failure, cancelled, etc.)
-            repo_filter: Optional repository name filter (supports partial matching)
+            repo_filter: Optional repository name filter (partial match, or an exact
+                name when prefixed with '=')
+            event_filter: Optional workflow run event filter (push, pull_request, etc.)
+            actor_filter: Optional filter for the user who triggered the workflow runs
+            skip_conclusions: Run conclusions whose jobs are left out (default:
+                skipped runs when filtering by label)
             
         Returns:
             List of runner usage data
         """
+        rows = self.iter_runner_usage(
+            target_label, days_back, status_filter, repo_filter, event_filter, actor_filter,
+            skip_conclusions
+        )
+        
+        # Group results if requested; grouping consumes the rows as they are produced
+        if group_by != "none":
+            results = self._group_results(rows, group_by)
+        else:
+            results = list(rows)
+        
+        if target_label:
+            self.logger.info(f"Found {len(results)} jobs using runner label: {target_label}")
+        else:
+            self.logger.info(f"Found {len(results)} total jobs across all runners")
+        
+        return results
+    
+    def iter_runner_usage(self, target_label: Optional[str] = None,
+                          days_back: int = 30,
+                          status_filter: Optional[str] = None,
+                          repo_filter: Optional[str] = None,
+                          event_filter: Optional[str] = None,
+                          actor_filter: Optional[str] = None,
+                          skip_conclusions: Optional[Iterable[str]] = None) -> Iterator[JobRow]:
+        """
+        Yield one usage row per matching job across the organization.
+        
+        Rows are produced as the data arrives instead of being collected into
+        a list, so consumers such as the CSV export can stream them.
+        
+        Args:
+            target_label: Optional runner label to filter for. If None, captures all runs.
+            days_back: Number of days to look back for analysis
+            status_filter: Optional status filter (completed, failure, cancelled, etc.)
+            repo_filter: Optional repository name filter (partial match, or an exact
+                name when prefixed with '=')
+            event_filter: Optional workflow run event filter (push, pull_request, etc.)
+            actor_filter: Optional filter for the user who triggered the workflow runs
+            skip_conclusions: Run conclusions whose jobs are left out (default:
+                skipped runs when filtering by label)
+            
+        Yields:
+            Usage row for a single job
+        """
         if target_label:
             self.logger.info(f"Analyzing runner usage for label: {target_label}")
         else:
@@ -183,83 +976,97 @@ class RunnerUsageAnalyzer:
             self.logger.info(f"Filtering by status: {status_filter}")
         if repo_filter:
             self.logger.info(f"Filtering by repository pattern: {repo_filter}")
+        if event_filter:
+            self.logger.info(f"Filtering by event: {event_filter}")
+        if actor_filter:
+            self.logger.info(f"Filtering by actor: {actor_filter}")
         
-        results = []
+        status = status_filter.lower() if status_filter else None
         
-        repos = self.get_repositories()
-        total_repos = len(repos)
+        # Runs that were skipped entirely never used a runner, so their jobs are
+        # not worth fetching when looking for a specific label
+        if skip_conclusions is None:
+            skip_conclusions = {'skipped'} if target_label else ()
+        skip_conclusions = frozenset(skip_conclusions) - {status}
+        if skip_conclusions:
+            self.logger.info(f"Skipping runs concluded as: {', '.join(sorted(skip_conclusions))}")
         
-        # Apply repository filter if specified
-        if repo_filter:
-            repos = [repo for repo in repos if repo_filter.lower() in repo['name'].lower()]
-            self.logger.info(f"Repository filter applied: {len(repos)} repositories match '{repo_filter}'")
+        # Apply repository filter if specified: a filter prefixed with '=' names
+        # a single repository, anything else is matched as a substring
+        if repo_filter and repo_filter.startswith(EXACT_REPO_PREFIX):
+            repo_name = repo_filter[len(EXACT_REPO_PREFIX):]
+            repo = self.get_repository(repo_name) if REPO_NAME_PATTERN.fullmatch(repo_name) else None
+            if repo:
+                self.logger.info(f"Analyzing single repository: {repo['name']}")
+                repos = [repo]
+            else:
+                self.logger.warning(f"Repository not found: {repo_name}")
+                repos = []
+        elif repo_filter:
+            repos = self.find_repositories(repo_filter)
+        else:
+            repos = self.get_repositories()
+        
+        # Repository details are stored once here instead of on every job row
+        self.repo_meta.update((repo['name'], RepoMeta(
+            branch=repo['default_branch'],
+            size=repo.get('size', 0),
+            language=repo.get('language', 'unknown'),
+            visibility=repo.get('visibility', 'unknown')
+        )) for repo in repos)
         
-        for idx, repo in enumerate(repos, 1):
+        run_jobs = self._iter_run_jobs(
+            repos, days_back, event_filter, actor_filter, target_label, skip_conclusions
+        )
+        # Bind the per-job helpers once; the loop below runs for every job
+        classify_runner = self._classify_runner
+        duration_seconds = self._duration_seconds
+        for repo, run, jobs in run_jobs:
             repo_name = repo['name']
-            default_branch = repo['default_branch']
-            
-            self.logger.info(f"Processing repository {idx}/{len(repos)}: {repo_name}")
-            
-            # Get workflow runs
-            runs = self.get_workflow_runs(repo_name, default_branch, days_back)
+            workflow_name = run['name']
+            run_id = run['id']
             
-            for run in runs:
-                workflow_name = run['name']
-                run_id = run['id']
+            for job in jobs:
+                job_labels = job.get('labels', [])
+                job_status = job.get('status', 'unknown')
+                runner_label = ', '.join(job_labels) if job_labels else 'unknown'
                 
-                # Get jobs for this run
-                jobs = self.get_jobs_for_run(repo_name, run_id)
+                # Match each job's status/conclusion; runs are not filtered by
+                # status because a failed run also contains successful jobs
+                if status and status not in (job_status.lower(), (job.get('conclusion') or '').lower()):
+                    continue
                 
-                for job in jobs:
-                    job_labels = job.get('labels', [])
-                    job_status = job.get('status', 'unknown')
-                    runner_label = ', '.join(job_labels) if job_labels else 'unknown'
+                # Filter by target label if specified, otherwise include all jobs
+                if target_label is None or target_label in job_labels:
+                    # Enhanced labeling and categorization
+                    runner_type, cost_category = classify_runner(job_labels)
                     
-                    # Apply status filter if specified
-                    if status_filter and status_filter.lower() != job_status.lower():
-                        continue
-                    
-                    # Filter by target label if specified, otherwise include all jobs
-                    if target_label is None or target_label in job_labels:
-                        # Enhanced labeling and categorization
-                        runner_type = self._categorize_runner(job_labels)
-                        cost_category = self._get_cost_category(job_labels)
-                        
-                        results.append({
-                            'Org': self.org_name,
-                            'Repo': repo_name,
-                            'Branch': default_branch,
-                            'Workflow File': run.get('path', ''),
-                            'Workflow Name': workflow_name,
-                            'Runner Labels': runner_label,
-                            'Runner Type': runner_type,
-                            'Cost Category': cost_category,
-                            'Job Name': job['name'],
-                            'Job Status': job_status,
-                            'Run Date': job.get('started_at', ''),
-                            'Completed Date': job.get('completed_at', ''),
-                            'Duration': self._calculate_duration(job),
-                            'Run ID': run_id,
-                            'Job ID': job.get('id', ''),
-                            'Conclusion': job.get('conclusion', 'unknown'),
-                            'HTML URL': job.get('html_url', ''),
-                            'Repository Size': repo.get('size', 0),
-                            'Repository Language': repo.get('language', 'unknown'),
-                            'Repository Visibility': repo.get('visibility', 'unknown')
-                        })
-        
-        # Group results if requested
-        if group_by != "none":
-            results = self._group_results(results, group_by)
-        
-        if target_label:
-            self.logger.info(f"Found {len(results)} jobs using runner label: {target_label}")
-        else:
-            self.logger.info(f"Found {len(results)} total jobs across all runners")
-        
-        return results
+                    yield JobRow(
+                        repo=repo_name,
+                        workflow_file=run.get('path', ''),
+                        workflow_name=workflow_name,
+                        runner_labels=runner_label,
+                        runner_type=runner_type,
+                        cost_category=cost_category,
+                        job_name=job['name'],
+                        job_status=job_status,
+                        run_date=job.get('started_at', ''),
+                        completed_date=job.get('completed_at', ''),
+                        duration_seconds=duration_seconds(job),
+                        run_id=run_id,
+                        job_id=job.get('id', ''),
+                        conclusion=job.get('conclusion', 'unknown'),
+                        html_url=job.get('html_url', '')
+                    )
+    
+    @staticmethod
+    def _completed_attempt(run: Dict[str, Any]) -> Optional[int]:
+        """Return the run attempt number if the workflow run has completed."""
+        if run.get('status') != 'completed':
+            return None
+        return run.get('run_attempt') or 1
     
-    def _calculate_duration(self, job: Dict[str, Any]) -> str:
+    def _duration_seconds(self, job: Dict[str, Any]) -> Optional[int]:
         """
         Calculate job duration from start and end times.
         
@@ -267,375 +1074,212 @@ class RunnerUsageAnalyzer:
             job: Job data dictionary
             
         Returns:
-            Duration string in format "MM:SS" or "unknown"
+            Duration in seconds, or None if it cannot be determined
         """
-        try:
-            started_at = job.get('started_at')
-            completed_at = job.get('completed_at')
-            
-            if started_at and completed_at:
-                start_time = datetime.fromisoformat(started_at.replace('Z', '+00:00'))
-                end_time = datetime.fromisoformat(completed_at.replace('Z', '+00:00'))
-                duration = end_time - start_time
-                
-                total_seconds = int(duration.total_seconds())
-                minutes = total_seconds // 60
-                seconds = total_seconds % 60
-                start_time = self._parse_iso_datetime(started_at)
-                end_time = self._parse_iso_datetime(completed_at)
-                if start_time and end_time:
-                    duration = end_time - start_time
-                    
-                    total_seconds = int(duration.total_seconds())
-                    minutes = total_seconds // 60
-                    seconds = total_seconds % 60
-                    return f"{minutes:02d}:{seconds:02d}"
-        except (ValueError, TypeError) as e:
-            self.logger.debug(f"Failed to calculate duration: {e}")
+        started_at = job.get('started_at')
+        completed_at = job.get('completed_at')
         
-        return "unknown"
+        if started_at and completed_at:
+            try:
+                return _iso_to_epoch(completed_at) - _iso_to_epoch(started_at)
+            except (ValueError, TypeError) as e:
+                self.logger.debug(f"Failed to calculate duration: {e}")
+        
+        return None
     
-    def _categorize_runner(self, labels: List[str]) -> str:
+    def _classify_runner(self, labels: List[str]) -> Tuple[str, str]:
         """
-        Categorize runner type based on labels.
+        Categorize runner type and cost based on labels.
+        
+        Both categories come from a single lower-cased label string, and the
+        result is memoized per label combination since jobs reuse a handful.
         
         Args:
             labels: List of runner labels
             
         Returns:
-            Runner category string
+            Tuple of (runner category, cost category)
         """
+        key = tuple(labels)
+        categories = self._runner_categories.get(key)
+        if categories is not None:
+            return categories
+        
         labels_str = ' '.join(labels).lower()
+        is_self_hosted = 'self-hosted' in labels_str
+        is_github_hosted = any(gh_label in labels_str for gh_label in self.GITHUB_HOSTED_LABELS)
         
-        if 'self-hosted' in labels_str:
-            return 'Self-hosted'
-        elif any(gh_label in labels_str for gh_label in ['ubuntu-latest', 'windows-latest', 'macos-latest']):
-            return 'GitHub-hosted'
+        if is_self_hosted:
+            runner_type = 'Self-hosted'
+        elif is_github_hosted:
+            runner_type = 'GitHub-hosted'
         elif 'ubuntu' in labels_str:
-            return 'Ubuntu'
+            runner_type = 'Ubuntu'
         elif 'windows' in labels_str:
-            return 'Windows'
+            runner_type = 'Windows'
         elif 'macos' in labels_str:
-            return 'macOS'
+            runner_type = 'macOS'
         elif 'linux' in labels_str:
-            return 'Linux'
+            runner_type = 'Linux'
         else:
-            return 'Unknown'
-    
-    def _get_cost_category(self, labels: List[str]) -> str:
-        """
-        Determine cost category based on runner labels.
-        
-        Args:
-            labels: List of runner labels
-            
-        Returns:
-            Cost category string
-        """
-        labels_str = ' '.join(labels).lower()
+            runner_type = 'Unknown'
         
-        if 'self-hosted' in labels_str:
-            return 'Self-hosted (Custom Cost)'
-        elif any(size in labels_str for size in ['large', 'xl', 'xxl', '4-core', '8-core', '16-core']):
-            return 'Large Instance'
-        elif any(gh_label in labels_str for gh_label in ['ubuntu-latest', 'windows-latest', 'macos-latest']):
-            return 'Standard GitHub-hosted'
+        if is_self_hosted:
+            cost_category = 'Self-hosted (Custom Cost)'
+        elif any(size in labels_str for size in self.LARGE_RUNNER_MARKERS):
+            cost_category = 'Large Instance'
+        elif is_github_hosted:
+            cost_category = 'Standard GitHub-hosted'
         else:
-            return 'Standard'
+            cost_category = 'Standard'
+        
+        categories = self._runner_categories[key] = (runner_type, cost_category)
+        return categories
     
-    def _group_results(self, results: List[Dict[str, Any]], group_by: str) -> List[Dict[str, Any]]:
+    def _group_results(self, results: Iterable[JobRow], group_by: str) -> List[GroupRow]:
         """
         Group results by specified field.
         
         Args:
-            results: List of result dictionaries
+            results: Iterable of job rows
             group_by: Field to group by
             
         Returns:
             Grouped results with summary statistics
         """
-        if not results:
-            return results
-        
-        from collections import defaultdict
-        
-        grouped = defaultdict(list)
-        
-        # Group results by the specified field
+        # Accumulate running totals per group in a single pass over the rows.
+        # Only the documented fields are looked up on the rows; any other
+        # value puts every job in a single 'Unknown' group.
+        grouped: Dict[Any, _GroupTotals] = {}
+        key_field = GROUP_BY_FIELDS.get(group_by)
+        repo_meta = self.repo_meta
         for result in results:
-            key = result.get(group_by.title(), 'Unknown')
-            if group_by == 'label':
-                key = result.get('Runner Labels', 'Unknown')
-            elif group_by == 'status':
-                key = result.get('Job Status', 'Unknown')
-            elif group_by == 'workflow':
-                key = result.get('Workflow Name', 'Unknown')
+            if key_field:
+                key = getattr(result, key_field)
             elif group_by == 'branch':
-                key = result.get('Branch', 'Unknown')
-            elif group_by == 'runner_type':
-                key = result.get('Runner Type', 'Unknown')
-            elif group_by == 'cost_category':
-                key = result.get('Cost Category', 'Unknown')
+                key = repo_meta.get(result.repo, UNKNOWN_REPO_META).branch
+            elif group_by == 'org':
+                key = self.org_name
+            else:
+                key = 'Unknown'
+            totals = grouped.get(key)
+            if totals is None:
+                totals = grouped[key] = _GroupTotals(result.repo)
+            
+            totals.total_jobs += 1
+            if result.job_status == 'completed':
+                totals.successful_jobs += 1
+            elif result.job_status == 'failure':
+                totals.failed_jobs += 1
             
-            grouped[key].append(result)
+            if result.duration_seconds is not None:
+                totals.duration_seconds += result.duration_seconds
+                totals.timed_jobs += 1
         
         # Create summary for each group
         summary_results = []
-        for group_key, group_items in grouped.items():
-            # Calculate group statistics
-            total_jobs = len(group_items)
-            successful_jobs = sum(1 for item in group_items if item.get('Job Status') == 'completed')
-            failed_jobs = sum(1 for item in group_items if item.get('Job Status') == 'failure')
-            
-            # Calculate average duration
-            durations = []
-            for item in group_items:
-                duration_str = item.get('Duration', '00:00')
-                if duration_str != 'unknown' and ':' in duration_str:
-                    try:
-                        minutes, seconds = map(int, duration_str.split(':'))
-                        durations.append(minutes * 60 + seconds)
-                    except ValueError:
-                        pass
+        for group_key, totals in grouped.items():
+            total_jobs = totals.total_jobs
+            successful_jobs = totals.successful_jobs
             
-            avg_duration = "unknown"
-            if durations:
-                avg_seconds = sum(durations) / len(durations)
-                avg_minutes = int(avg_seconds // 60)
-                avg_secs = int(avg_seconds % 60)
-                avg_duration = f"{avg_minutes:02d}:{avg_secs:02d}"
+            avg_seconds = totals.duration_seconds // totals.timed_jobs if totals.timed_jobs else None
             
             # Add group summary
-            summary_results.append({
-                'Group': group_key,
-                'Group Type': group_by.title(),
-                'Total Jobs': total_jobs,
-                'Successful Jobs': successful_jobs,
-                'Failed Jobs': failed_jobs,
-                'Success Rate': f"{(successful_jobs/total_jobs*100):.1f}%" if total_jobs > 0 else "0%",
-                'Average Duration': avg_duration,
-                'Sample Repository': group_items[0].get('Repo', 'Unknown') if group_items else 'Unknown'
-            })
+            summary_results.append(GroupRow(
+                group=group_key,
+                group_type=group_by.title(),
+                total_jobs=total_jobs,
+                successful_jobs=successful_jobs,
+                failed_jobs=totals.failed_jobs,
+                success_rate=f"{(successful_jobs/total_jobs*100):.1f}%" if total_jobs > 0 else "0%",
+                average_duration_seconds=avg_seconds,
+                sample_repository=totals.sample_repository
+            ))
         
         return summary_results
 
 
-class ReportGenerator:
-    """Handles generation of various report formats."""
-    
-    def __init__(self, org_name: str):
-        """
-        Initialize the report generator.
-        
-        Args:
-            org_name: Organization name for report context
-        """
-        self.org_name = org_name
-        self.logger = logging.getLogger(__name__)
-    
-    def export_to_csv(self, data: List[Dict[str, Any]], 
-                     filename: str = "runner_usage_report.csv") -> None:
-        """
-        Export results to CSV format.
-        
-        Args:
-            data: List of runner usage data
-            filename: Output CSV filename
-        """
-        if not data:
-            self.logger.warning("No data to export to CSV")
-            return
-        
-        try:
-            keys = data[0].keys()
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=keys)
-                writer.writeheader()
-                writer.writerows(data)
-            
-            self.logger.info(f"CSV report exported to {filename}")
-        except Exception as e:
-            self.logger.error(f"Failed to export CSV: {e}")
-            raise
-
-    def generate_html_report(self, data: List[Dict[str, Any]], 
-                           filename: str = "runner_usage_report.html") -> None:
-        """
-        Generate an HTML report with nice styling.
-        
-        Args:
-            data: List of runner usage data
-            filename: Output HTML filename
-        """
-        if not data:
-            self.logger.warning("No data to generate HTML report")
-            self._generate_empty_html_report(filename)
-            return
-
-        try:
-            # Calculate statistics
-            total_jobs = len(data)
-            
-            # Check if data is grouped
-            is_grouped = len(data) > 0 and 'Group' in data[0]
-            
-            if is_grouped:
-                unique_groups = len(data)
-                unique_repos = len(set(item.get('Sample Repository', 'Unknown') for item in data))
-                unique_workflows = 0  # Not applicable for grouped data
-                
-                # Count by group type
-                repo_counts = Counter(item.get('Sample Repository', 'Unknown') for item in data)
-                status_counts = Counter()  # Will calculate from grouped data
-                label_counts = Counter(item.get('Group', 'Unknown') for item in data)
-                
-                # Calculate total successful/failed from grouped data
-                total_successful = sum(item.get('Successful Jobs', 0) for item in data)
-                total_failed = sum(item.get('Failed Jobs', 0) for item in data)
-                status_counts['completed'] = total_successful
-                status_counts['failure'] = total_failed
-            else:
-                unique_repos = len(set(item['Repo'] for item in data))
-                unique_workflows = len(set(item['Workflow File'] for item in data))
-                
-                # Count jobs by repository and status
-                repo_counts = Counter(item['Repo'] for item in data)
-                status_counts = Counter(item['Job Status'] for item in data)
-                label_counts = Counter(item['Runner Labels'] for item in data)
-            
-            html_content = self._generate_html_template(
-                total_jobs, unique_repos, unique_workflows, 
-                repo_counts, status_counts, label_counts, data, is_grouped
-            )
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            self.logger.info(f"HTML report exported to {filename}")
-        except Exception as e:
-            self.logger.error(f"Failed to generate HTML report: {e}")
-            raise
-    
-    def _generate_empty_html_report(self, filename: str) -> None:
-        """Generate HTML report when no data is available."""
-        html_content = f"""
+# HTML report layout, split around the parts generated per report; the
+# *_FMT pieces are filled in with str.format_map
+HTML_DOC_OPEN_FMT = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Runner Usage Report - {self.org_name}</title>
+    <title>Runner Usage Report - {org}</title>
     <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            text-align: center;
-            padding: 2rem;
-            background: #f6f8fa;
-        }}
-        .container {{
-            max-width: 600px;
-            margin: 0 auto;
-            background: white;
-            padding: 2rem;
-            border-radius: 8px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🏃‍♂️ Runner Usage Report</h1>
-        <p>Organization: <strong>{self.org_name}</strong></p>
-        <p>No runner usage data found for the specified criteria.</p>
-        <p><em>Generated on {datetime.now().strftime('%B %d, %Y at %H:%M UTC')}</em></p>
-    </div>
-</body>
-</html>
 """
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-    
-    def _generate_html_template(self, total_jobs: int, unique_repos: int, 
-                              unique_workflows: int, repo_counts: Counter, 
-                              status_counts: Counter, label_counts: Counter, 
-                              data: List[Dict], is_grouped: bool = False) -> str:
-        """Generate the main HTML template with data."""
-        return f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Runner Usage Report - {self.org_name}</title>
-    <style>
-        body {{
+
+# Static stylesheet, emitted verbatim
+HTML_STYLE = """        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Noto Sans', Helvetica, Arial, sans-serif;
             line-height: 1.5;
             color: #24292f;
             background-color: #ffffff;
             margin: 0;
             padding: 20px;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 2rem;
             border-radius: 8px;
             margin-bottom: 2rem;
             text-align: center;
-        }}
-        .stats-grid {{
+        }
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 1rem;
             margin-bottom: 2rem;
-        }}
-        .stat-card {{
+        }
+        .stat-card {
             background: #f6f8fa;
             border: 1px solid #d0d7de;
             border-radius: 6px;
             padding: 1rem;
             text-align: center;
-        }}
-        .stat-number {{
+        }
+        .stat-number {
             font-size: 2rem;
             font-weight: bold;
             color: #0969da;
-        }}
-        .stat-label {{
+        }
+        .stat-label {
             color: #656d76;
             margin-top: 0.5rem;
-        }}
-        .section {{
+        }
+        .section {
             background: white;
             border: 1px solid #d0d7de;
             border-radius: 6px;
             padding: 1.5rem;
             margin-bottom: 2rem;
-        }}
-        .section h2 {{
+        }
+        .section h2 {
             margin-top: 0;
             color: #24292f;
             border-bottom: 1px solid #d0d7de;
             padding-bottom: 0.5rem;
-        }}
-        .table-container {{
+        }
+        .table-container {
             overflow-x: auto;
             margin-top: 1rem;
             border: 1px solid #d0d7de;
             border-radius: 6px;
             background: white;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             min-width: 800px;
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 0.5rem 0.75rem;
             text-align: left;
             border-bottom: 1px solid #d0d7de;
@@ -643,8 +1287,8 @@ class ReportGenerator:
             overflow: hidden;
             text-overflow: ellipsis;
             max-width: 200px;
-        }}
-        th {{
+        }
+        th {
             background-color: #f6f8fa;
             font-weight: 600;
             position: sticky;
@@ -652,103 +1296,103 @@ class ReportGenerator:
             z-index: 10;
             cursor: pointer;
             user-select: none;
-        }}
-        th:hover {{
+        }
+        th:hover {
             background-color: #e6edf3;
-        }}
-        th.sortable::after {{
+        }
+        th.sortable::after {
             content: ' ↕️';
             font-size: 0.8em;
             opacity: 0.5;
-        }}
-        th.sort-asc::after {{
+        }
+        th.sort-asc::after {
             content: ' ↑';
             opacity: 1;
-        }}
-        th.sort-desc::after {{
+        }
+        th.sort-desc::after {
             content: ' ↓';
             opacity: 1;
-        }}
-        tr:hover {{
+        }
+        tr:hover {
             background-color: #f6f8fa;
-        }}
+        }
         /* Responsive column widths */
-        th:nth-child(1), td:nth-child(1) {{ max-width: 150px; }} /* Repository */
-        th:nth-child(2), td:nth-child(2) {{ max-width: 200px; }} /* Workflow */
-        th:nth-child(3), td:nth-child(3) {{ max-width: 150px; }} /* Job Name */
-        th:nth-child(4), td:nth-child(4) {{ max-width: 120px; }} /* Runner Labels */
-        th:nth-child(5), td:nth-child(5) {{ max-width: 120px; }} /* Runner Type */
-        th:nth-child(6), td:nth-child(6) {{ max-width: 100px; }} /* Status */
-        th:nth-child(7), td:nth-child(7) {{ max-width: 80px; }} /* Duration */
-        th:nth-child(8), td:nth-child(8) {{ max-width: 140px; }} /* Run Date */
-        .badge {{
+        th:nth-child(1), td:nth-child(1) { max-width: 150px; } /* Repository */
+        th:nth-child(2), td:nth-child(2) { max-width: 200px; } /* Workflow */
+        th:nth-child(3), td:nth-child(3) { max-width: 150px; } /* Job Name */
+        th:nth-child(4), td:nth-child(4) { max-width: 120px; } /* Runner Labels */
+        th:nth-child(5), td:nth-child(5) { max-width: 120px; } /* Runner Type */
+        th:nth-child(6), td:nth-child(6) { max-width: 100px; } /* Status */
+        th:nth-child(7), td:nth-child(7) { max-width: 80px; } /* Duration */
+        th:nth-child(8), td:nth-child(8) { max-width: 140px; } /* Run Date */
+        .badge {
             padding: 0.25rem 0.5rem;
             border-radius: 4px;
             font-size: 0.875rem;
             font-weight: 500;
-        }}
-        .badge-success {{ background-color: #28a745; color: white; }}
-        .badge-failure {{ background-color: #dc3545; color: white; }}
-        .badge-in-progress {{ background-color: #fd7e14; color: white; }}
-        .badge-default {{ background-color: #6c757d; color: white; }}
-        .chart-container {{
+        }
+        .badge-success { background-color: #28a745; color: white; }
+        .badge-failure { background-color: #dc3545; color: white; }
+        .badge-in-progress { background-color: #fd7e14; color: white; }
+        .badge-default { background-color: #6c757d; color: white; }
+        .chart-container {
             margin: 1rem 0;
             padding: 1.5rem;
             background: #f6f8fa;
             border-radius: 8px;
             border: 1px solid #d0d7de;
-        }}
-        .chart-header {{
+        }
+        .chart-header {
             margin-bottom: 1.5rem;
             text-align: center;
-        }}
-        .chart-header h3 {{
+        }
+        .chart-header h3 {
             margin: 0 0 0.5rem 0;
             color: #24292f;
             font-size: 1.1rem;
             font-weight: 600;
-        }}
-        .chart-description {{
+        }
+        .chart-description {
             margin: 0;
             color: #656d76;
             font-size: 0.875rem;
             line-height: 1.4;
-        }}
-        .bar-chart {{
+        }
+        .bar-chart {
             display: flex;
             flex-direction: column;
             gap: 0.75rem;
-        }}
-        .bar-item {{
+        }
+        .bar-item {
             display: flex;
             flex-direction: column;
             gap: 0.5rem;
-        }}
-        .bar-label {{
+        }
+        .bar-label {
             display: flex;
             justify-content: space-between;
             align-items: center;
             min-height: 1.5rem;
-        }}
-        .repo-name {{
+        }
+        .repo-name {
             font-weight: 600;
             color: #24292f;
             font-size: 0.875rem;
-        }}
-        .job-count {{
+        }
+        .job-count {
             font-size: 0.75rem;
             color: #656d76;
             font-weight: 500;
-        }}
-        .bar-container {{
+        }
+        .bar-container {
             width: 100%;
             height: 28px;
             background: #e1e4e8;
             border-radius: 14px;
             overflow: hidden;
             position: relative;
-        }}
-        .bar {{
+        }
+        .bar {
             background: linear-gradient(90deg, #0969da, #54aeff);
             height: 100%;
             border-radius: 14px;
@@ -762,92 +1406,94 @@ class ReportGenerator:
             min-width: 40px;
             position: relative;
             transition: all 0.3s ease;
-        }}
-        .bar:hover {{
+        }
+        .bar:hover {
             background: linear-gradient(90deg, #0860ca, #4a9eff);
             transform: scaleY(1.1);
-        }}
-        .bar-value {{
+        }
+        .bar-value {
             text-shadow: 0 1px 2px rgba(0,0,0,0.3);
-        }}
-        .chart-footer {{
+        }
+        .chart-footer {
             margin-top: 1.5rem;
             padding-top: 1rem;
             border-top: 1px solid #d0d7de;
             text-align: center;
-        }}
-        .text-muted {{
+        }
+        .text-muted {
             color: #656d76;
             font-style: italic;
-        }}
+        }
         
         /* Responsive design for charts */
-        @media (max-width: 768px) {{
-            .chart-container {{
+        @media (max-width: 768px) {
+            .chart-container {
                 padding: 1rem;
-            }}
-            .bar-label {{
+            }
+            .bar-label {
                 flex-direction: column;
                 align-items: flex-start;
                 gap: 0.25rem;
-            }}
-            .repo-name {{
+            }
+            .repo-name {
                 font-size: 0.8rem;
-            }}
-            .job-count {{
+            }
+            .job-count {
                 font-size: 0.7rem;
-            }}
-            .bar-container {{
+            }
+            .bar-container {
                 height: 24px;
-            }}
-            .bar {{
+            }
+            .bar {
                 padding: 0 0.5rem;
                 font-size: 0.7rem;
-            }}
-        }}
+            }
+        }
         
         /* Animation for chart loading */
-        @keyframes slideIn {{
-            from {{
+        @keyframes slideIn {
+            from {
                 opacity: 0;
                 transform: translateX(-20px);
-            }}
-            to {{
+            }
+            to {
                 opacity: 1;
                 transform: translateX(0);
-            }}
-        }}
+            }
+        }
         
-        .bar-item {{
+        .bar-item {
             animation: slideIn 0.6s ease-out;
-        }}
+        }
         
-        .bar-item:nth-child(1) {{ animation-delay: 0.1s; }}
-        .bar-item:nth-child(2) {{ animation-delay: 0.2s; }}
-        .bar-item:nth-child(3) {{ animation-delay: 0.3s; }}
-        .bar-item:nth-child(4) {{ animation-delay: 0.4s; }}
-        .bar-item:nth-child(5) {{ animation-delay: 0.5s; }}
-        .bar-item:nth-child(6) {{ animation-delay: 0.6s; }}
-        .bar-item:nth-child(7) {{ animation-delay: 0.7s; }}
-        .bar-item:nth-child(8) {{ animation-delay: 0.8s; }}
-        .bar-item:nth-child(9) {{ animation-delay: 0.9s; }}
-        .bar-item:nth-child(10) {{ animation-delay: 1.0s; }}
-        .timestamp {{
+        .bar-item:nth-child(1) { animation-delay: 0.1s; }
+        .bar-item:nth-child(2) { animation-delay: 0.2s; }
+        .bar-item:nth-child(3) { animation-delay: 0.3s; }
+        .bar-item:nth-child(4) { animation-delay: 0.4s; }
+        .bar-item:nth-child(5) { animation-delay: 0.5s; }
+        .bar-item:nth-child(6) { animation-delay: 0.6s; }
+        .bar-item:nth-child(7) { animation-delay: 0.7s; }
+        .bar-item:nth-child(8) { animation-delay: 0.8s; }
+        .bar-item:nth-child(9) { animation-delay: 0.9s; }
+        .bar-item:nth-child(10) { animation-delay: 1.0s; }
+        .timestamp {
             color: #656d76;
             font-size: 0.875rem;
             text-align: center;
             margin-top: 2rem;
             padding-top: 1rem;
             border-top: 1px solid #d0d7de;
-        }}
-    </style>
+        }
+"""
+
+HTML_HEADER_FMT = """    </style>
 </head>
 <body>
     <div class="container">
         <div class="header">
             <h1>🏃‍♂️ Runner Usage Analytics</h1>
-            <p>Organization: <strong>{self.org_name}</strong></p>
-            <p>Report generated on {datetime.now().strftime('%B %d, %Y at %H:%M UTC')}</p>
+            <p>Organization: <strong>{org}</strong></p>
+            <p>Report generated on {report_time}</p>
         </div>
 
         <div class="stats-grid">
@@ -864,7 +1510,7 @@ class ReportGenerator:
                 <div class="stat-label">Workflow Files</div>
             </div>
             <div class="stat-card">
-                <div class="stat-number">{status_counts.get('completed', 0)}</div>
+                <div class="stat-number">{completed}</div>
                 <div class="stat-label">Completed Jobs</div>
             </div>
         </div>
@@ -877,7 +1523,9 @@ class ReportGenerator:
                     <p class="chart-description">Shows the total number of workflow jobs executed per repository, with repositories ordered by activity.</p>
                 </div>
                 <div class="bar-chart">
-{self._generate_repo_chart_html(repo_counts)}
+"""
+
+HTML_LABELS_CHART_FMT = """
                 </div>
                 <div class="chart-footer">
                     <small class="text-muted">
@@ -895,7 +1543,9 @@ class ReportGenerator:
                     <p class="chart-description">Shows the distribution of jobs across different runner types and operating systems.</p>
                 </div>
                 <div class="bar-chart">
-{self._generate_labels_chart_html(label_counts)}
+"""
+
+HTML_TABLE_FMT = """
                 </div>
                 <div class="chart-footer">
                     <small class="text-muted">
@@ -906,16 +1556,20 @@ class ReportGenerator:
         </div>
 
         <div class="section">
-            <h2>📋 {'Group Summary' if is_grouped else 'Detailed Job Reports'}</h2>
+            <h2>📋 {table_title}</h2>
             <div class="table-container">
                 <table id="jobsTable">
                     <thead>
                         <tr>
-{self._generate_table_header_html(is_grouped)}
+"""
+
+HTML_TABLE_BODY_OPEN = """
                         </tr>
                     </thead>
                     <tbody>
-{self._generate_jobs_table_html(data, is_grouped)}
+"""
+
+HTML_TABLE_CLOSE = """
                     </tbody>
                 </table>
             </div>
@@ -926,72 +1580,86 @@ class ReportGenerator:
         </div>
     </div>
 
+    <script type="application/json" id="report-rows">"""
+
+HTML_TAIL = """</script>
     <script>
-        // Table sorting functionality
-        function sortTable(table, column, direction) {{
+        // Render the table rows from the embedded JSON, which parses far faster
+        // than the equivalent markup. Values are escaped before insertion.
+        const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;' };
+        const esc = value => String(value ?? '').replace(/[&<>"]/g, c => HTML_ESCAPES[c]);
+        
+        const groupRow = r => `<tr>
+                            <td><strong>${esc(r[0])}</strong></td>
+                            <td>${esc(r[1])}</td>
+                            <td>${r[2]}</td>
+                            <td>${r[3]}</td>
+                            <td>${r[4]}</td>
+                            <td data-sort="${r[7]}"><span class="badge ${r[6]}">${esc(r[5])}</span></td>
+                            <td data-sort="${r[9]}">${esc(r[8])}</td>
+                        </tr>`;
+        
+        const jobRow = r => `<tr>
+                            <td><strong>${esc(r[0])}</strong></td>
+                            <td>${esc(r[1])}</td>
+                            <td>${esc(r[2])}</td>
+                            <td><span class="badge badge-default">${esc(r[3])}</span></td>
+                            <td><span class="badge badge-default" title="${esc(r[5])}">${esc(r[4])}</span></td>
+                            <td><span class="badge ${r[7]}">${esc(r[6])}</span></td>
+                            <td data-sort="${r[9]}">${esc(r[8])}</td>
+                            <td data-sort="${esc(r[10])}">${esc(r[10])}</td>
+                        </tr>`;
+        
+        (function renderRows() {
+            const report = JSON.parse(document.getElementById('report-rows').textContent);
+            const tbody = document.querySelector('#jobsTable tbody');
+            tbody.innerHTML = report.rows.map(report.grouped ? groupRow : jobRow).join('');
+        })();
+        
+        // One collator for every text comparison instead of localeCompare per call
+        const collator = new Intl.Collator(undefined, { numeric: true, sensitivity: 'base' });
+        
+        // Table sorting functionality. Numeric and date cells carry a data-sort
+        // key rendered by the report generator, so no parsing happens here.
+        function sortTable(table, column, direction) {
             const tbody = table.querySelector('tbody');
-            const rows = Array.from(tbody.querySelectorAll('tr'));
-            
-            const sortedRows = rows.sort((a, b) => {{
-                const aText = a.cells[column].textContent.trim();
-                const bText = b.cells[column].textContent.trim();
-                
-                // Handle numeric sorting for duration column
-                if (column === 6 || (column === 2 && aText.match(/^\\d+$/))) {{ // Duration column or numeric data
-                    const aMinutes = parseDuration(aText);
-                    const bMinutes = parseDuration(bText);
-                    return direction === 'asc' ? aMinutes - bMinutes : bMinutes - aMinutes;
-                }}
-                
-                // Handle date sorting
-                if (column === DURATION_COLUMN_INDEX || (column === RUN_ID_COLUMN_INDEX && aText.match(/^\\d+$/))) {{ // Duration column or numeric data
-                    const aMinutes = parseDuration(aText);
-                    const bMinutes = parseDuration(bText);
-                    return direction === 'asc' ? aMinutes - bMinutes : bMinutes - aMinutes;
-                }}
-                
-                // Handle date sorting
-                if (column === RUN_DATE_COLUMN_INDEX || aText.match(/^\\d{{4}}-\\d{{2}}-\\d{{2}}/)) {{ // Run Date column or date format
-                    const aDate = new Date(aText);
-                    const bDate = new Date(bText);
-                    return direction === 'asc' ? aDate - bDate : bDate - aDate;
-                }}
-                
-                // Default string sorting
-                return direction === 'asc' 
-                    ? aText.localeCompare(bText)
-                    : bText.localeCompare(aText);
-            }});
+            const sortType = table.tHead.rows[0].cells[column].dataset.sortType || 'text';
             
-            // Clear tbody and append sorted rows
-            tbody.innerHTML = '';
-            sortedRows.forEach(row => tbody.appendChild(row));
-        }}
-        
-        function parseDuration(duration) {{
-            // Parse duration format like "02:38", "00:00", "-1:59", or plain numbers
-            if (duration.match(/^\\d+$/)) return parseInt(duration);
+            // Read each row's key once rather than on every comparison
+            const keyed = Array.from(tbody.rows, row => {
+                const cell = row.cells[column];
+                const key = cell.dataset.sort !== undefined ? cell.dataset.sort : cell.textContent.trim();
+                return [sortType === 'number' ? Number(key) : key, row];
+            });
             
-            const parts = duration.split(':');
-            if (parts.length !== 2) return 0;
+            const sign = direction === 'asc' ? 1 : -1;
+            if (sortType === 'number') {
+                keyed.sort((a, b) => sign * (a[0] - b[0]));
+            } else if (sortType === 'date') {
+                // ISO 8601 timestamps order chronologically as plain strings
+                keyed.sort((a, b) => sign * (a[0] < b[0] ? -1 : a[0] > b[0] ? 1 : 0));
+            } else {
+                keyed.sort((a, b) => sign * collator.compare(a[0], b[0]));
+            }
             
-            const hours = parseInt(parts[0]) || 0;
-            const minutes = parseInt(parts[1]) || 0;
-            return hours * 60 + minutes;
-        }}
+            // Re-append the rows in their new order (appending moves existing nodes)
+            const fragment = document.createDocumentFragment();
+            keyed.forEach(entry => fragment.appendChild(entry[1]));
+            tbody.appendChild(fragment);
+        }
         
         // Initialize table sorting
-        document.addEventListener('DOMContentLoaded', function() {{
+        document.addEventListener('DOMContentLoaded', function() {
             const table = document.getElementById('jobsTable');
             if (!table) return;
             
             const headers = table.querySelectorAll('th');
             
-            headers.forEach((header, index) => {{
+            headers.forEach((header, index) => {
                 header.classList.add('sortable');
                 header.dataset.column = index;
                 
-                header.addEventListener('click', function() {{
+                header.addEventListener('click', function() {
                     const column = parseInt(this.dataset.column);
                     const currentSort = this.classList.contains('sort-asc') ? 'asc' : 
                                       this.classList.contains('sort-desc') ? 'desc' : null;
@@ -1001,71 +1669,299 @@ class ReportGenerator:
                     
                     // Determine new sort direction
                     let newDirection;
-                    if (currentSort === 'asc') {{
+                    if (currentSort === 'asc') {
                         newDirection = 'desc';
                         this.classList.add('sort-desc');
-                    }} else {{
+                    } else {
                         newDirection = 'asc';
                         this.classList.add('sort-asc');
-                    }}
+                    }
                     
                     sortTable(table, column, newDirection);
-                }});
-            }});
-        }});
+                });
+            });
+        });
     </script>
 </body>
 </html>
 """
-    
-    def _generate_repo_chart_html(self, repo_counts: Counter) -> str:
-        """Generate HTML for repository usage chart."""
-        html = ""
-        max_count = max(repo_counts.values()) if repo_counts else 1
-        
-        for repo, count in repo_counts.most_common(10):
-            width_percent = (count / max_count) * 100
-            job_text = "job" if count == 1 else "jobs"
-            html += f"""
+
+# CSS badge class for each job status
+STATUS_BADGE_CLASSES = {
+    'completed': 'badge-success',
+    'success': 'badge-success',
+    'failure': 'badge-failure',
+    'cancelled': 'badge-failure',
+    'in_progress': 'badge-in-progress',
+    'queued': 'badge-in-progress'
+}
+
+# Singular forms of "jobs" for chart bar captions
+JOB_WORDS = {1: "job"}
+
+# One bar of the repository / runner label charts
+BAR_ITEM_HTML = """
                     <div class="bar-item">
                         <div class="bar-label">
-                            <span class="repo-name">{repo}</span>
+                            <span class="repo-name">{name}</span>
                             <span class="job-count">{count} {job_text}</span>
                         </div>
                         <div class="bar-container">
-                            <div class="bar" style="width: {width_percent}%">
+                            <div class="bar" style="width: {width_percent:.1f}%">
                                 <span class="bar-value">{count}</span>
                             </div>
                         </div>
                     </div>"""
+
+
+class ReportGenerator:
+    """Handles generation of various report formats."""
+    
+    def __init__(self, org_name: str):
+        """
+        Initialize the report generator.
         
-        return html
+        Args:
+            org_name: Organization name for report context
+        """
+        self.org_name = org_name
+        self.logger = logging.getLogger(__name__)
+        # Statistics of the most recently summarized data, shared between reports
+        # that may be generated on different threads
+        self._summary_cache: Optional[Tuple[List[Union[JobRow, GroupRow]], ReportStats]] = None
+        self._summary_lock = threading.Lock()
     
-    def _generate_labels_chart_html(self, label_counts: Counter) -> str:
-        """Generate HTML for runner labels usage chart."""
-        html = ""
-        max_count = max(label_counts.values()) if label_counts else 1
+    def export_to_csv(self, data: Iterable[Union[JobRow, GroupRow]], 
+                     filename: str = "runner_usage_report.csv",
+                     repo_meta: Optional[Dict[str, RepoMeta]] = None) -> None:
+        """
+        Export results to CSV format.
         
-        for labels, count in label_counts.most_common(10):
-            width_percent = (count / max_count) * 100
-            # Truncate long label strings for display
-            display_labels = labels if len(labels) <= 30 else labels[:27] + "..."
-            job_text = "job" if count == 1 else "jobs"
-            html += f"""
-                    <div class="bar-item">
-                        <div class="bar-label">
-                            <span class="repo-name">{display_labels}</span>
-                            <span class="job-count">{count} {job_text}</span>
-                        </div>
-                        <div class="bar-container">
-                            <div class="bar" style="width: {width_percent}%">
-                                <span class="bar-value">{count}</span>
-                            </div>
-                        </div>
-                    </div>"""
+        Rows are written as they are read, so data may be a generator such as
+        RunnerUsageAnalyzer.iter_runner_usage() and is never held in memory.
+        
+        Args:
+            data: Iterable of job or group rows
+            filename: Output CSV filename
+            repo_meta: Repository details joined onto job rows, keyed by name
+        """
+        rows = iter(data)
+        first_row = next(rows, None)
+        if first_row is None:
+            self.logger.warning("No data to export to CSV")
+            return
+        
+        try:
+            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+                writer = csv.writer(csvfile)
+                rows = itertools.chain((first_row,), rows)
+                if isinstance(first_row, GroupRow):
+                    writer.writerow(GROUP_CSV_HEADERS)
+                    writer.writerows(
+                        (*row[:_AVERAGE_DURATION_INDEX], row.average_duration, *row[_AVERAGE_DURATION_INDEX + 1:])
+                        for row in rows
+                    )
+                else:
+                    writer.writerow(JOB_CSV_HEADERS)
+                    writer.writerows(self._iter_job_csv_rows(rows, repo_meta or {}))
+            
+            self.logger.info(f"CSV report exported to {filename}")
+        except Exception as e:
+            self.logger.error(f"Failed to export CSV: {e}")
+            raise
+
+    def _iter_job_csv_rows(self, rows: Iterable[JobRow],
+                           repo_meta: Dict[str, RepoMeta]) -> Iterator[Tuple[Any, ...]]:
+        """Yield job rows as CSV records joined with their repository details."""
+        org = self.org_name
+        get_meta = repo_meta.get
+        for row in rows:
+            meta = get_meta(row.repo, UNKNOWN_REPO_META)
+            yield (org, row.repo, meta.branch, *row[1:_DURATION_INDEX], row.duration,
+                   *row[_DURATION_INDEX + 1:], meta.size, meta.language, meta.visibility)
+
+    def generate_html_report(self, data: List[Union[JobRow, GroupRow]], 
+                           filename: str = "runner_usage_report.html") -> None:
+        """
+        Generate an HTML report with nice styling.
+        
+        Args:
+            data: List of runner usage data
+            filename: Output HTML filename
+        """
+        if not data:
+            self.logger.warning("No data to generate HTML report")
+            self._generate_empty_html_report(filename)
+            return
+
+        try:
+            stats = self._summarize(data)
+            
+            # Write the report piece by piece rather than building one large string
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.writelines(self._iter_html(data, stats))
+            
+            self.logger.info(f"HTML report exported to {filename}")
+        except Exception as e:
+            self.logger.error(f"Failed to generate HTML report: {e}")
+            raise
+    
+    def _summarize(self, data: List[Union[JobRow, GroupRow]]) -> ReportStats:
+        """
+        Count jobs by repository, status and runner labels in a single pass.
+        
+        The result is remembered, so the HTML report and the GitHub summary of
+        the same data share one pass.
+        
+        Args:
+            data: Non-empty list of job rows or group rows
+            
+        Returns:
+            Aggregate figures for the report headers and charts
+        """
+        with self._summary_lock:
+            cached = self._summary_cache
+            if cached is None or cached[0] is not data:
+                self._summary_cache = cached = (data, self._compute_stats(data))
+            return cached[1]
+    
+    @staticmethod
+    def _compute_stats(data: List[Union[JobRow, GroupRow]]) -> ReportStats:
+        """Aggregate the figures returned by _summarize."""
+        repo_counts, status_counts, label_counts = Counter(), Counter(), Counter()
+        is_grouped = isinstance(data[0], GroupRow)
+        
+        if is_grouped:
+            # Groups carry their own totals, so every figure is weighted by
+            # the jobs in the group; workflows are not applicable
+            workflow_files = ()
+            total_jobs = 0
+            for item in data:
+                total_jobs += item.total_jobs
+                repo_counts[item.sample_repository] += item.total_jobs
+                label_counts[item.group] += item.total_jobs
+                status_counts['completed'] += item.successful_jobs
+                status_counts['failure'] += item.failed_jobs
+        else:
+            total_jobs = len(data)
+            workflow_files = set()
+            for item in data:
+                repo_counts[item.repo] += 1
+                status_counts[item.job_status] += 1
+                label_counts[item.runner_labels] += 1
+                workflow_files.add(item.workflow_file)
+        
+        return ReportStats(
+            total_jobs=total_jobs,
+            unique_repos=len(repo_counts),
+            unique_workflows=len(workflow_files),
+            repo_counts=repo_counts,
+            status_counts=status_counts,
+            label_counts=label_counts,
+            is_grouped=is_grouped
+        )
+    
+    def _generate_empty_html_report(self, filename: str) -> None:
+        """Generate HTML report when no data is available."""
+        org = self.org_name
+        report_time = datetime.now().strftime('%B %d, %Y at %H:%M UTC')
+        html_content = f"""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Runner Usage Report - {org}</title>
+    <style>
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+            text-align: center;
+            padding: 2rem;
+            background: #f6f8fa;
+        }}
+        .container {{
+            max-width: 600px;
+            margin: 0 auto;
+            background: white;
+            padding: 2rem;
+            border-radius: 8px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🏃‍♂️ Runner Usage Report</h1>
+        <p>Organization: <strong>{org}</strong></p>
+        <p>No runner usage data found for the specified criteria.</p>
+        <p><em>Generated on {report_time}</em></p>
+    </div>
+</body>
+</html>
+"""
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+    
+    def _iter_html(self, data: List[Union[JobRow, GroupRow]], stats: ReportStats) -> Iterator[str]:
+        """
+        Yield the HTML report in chunks so it never has to be held in memory whole.
+        
+        Args:
+            data: Non-empty list of job rows or group rows
+            stats: Aggregate figures for data
+            
+        Yields:
+            Consecutive pieces of the HTML document
+        """
+        fields = {
+            'org': self.org_name,
+            'report_time': datetime.now().strftime('%B %d, %Y at %H:%M UTC'),
+            'total_jobs': stats.total_jobs,
+            'unique_repos': stats.unique_repos,
+            'unique_workflows': stats.unique_workflows,
+            'completed': stats.status_counts.get('completed', 0),
+            'table_title': 'Group Summary' if stats.is_grouped else 'Detailed Job Reports'
+        }
+        
+        yield HTML_DOC_OPEN_FMT.format_map(fields)
+        yield HTML_STYLE
+        yield HTML_HEADER_FMT.format_map(fields)
+        yield from self._iter_repo_chart(stats.repo_counts)
+        yield HTML_LABELS_CHART_FMT.format_map(fields)
+        yield from self._iter_labels_chart(stats.label_counts)
+        yield HTML_TABLE_FMT.format_map(fields)
+        yield self._generate_table_header_html(stats.is_grouped)
+        yield HTML_TABLE_BODY_OPEN
+        yield HTML_TABLE_CLOSE
+        yield self._table_rows_json(data, stats.is_grouped)
+        yield HTML_TAIL
+    
+    def _iter_repo_chart(self, repo_counts: Counter) -> Iterator[str]:
+        """Yield one repository usage chart bar per repository."""
+        top = repo_counts.most_common(10)
+        if not top:
+            return
+        # Bars are scaled against the largest count, which most_common lists first
+        scale = 100.0 / top[0][1]
         
-        return html
+        for repo, count in top:
+            yield BAR_ITEM_HTML.format(
+                name=repo, count=count, job_text=JOB_WORDS.get(count, "jobs"), width_percent=count * scale
+            )
     
+    def _iter_labels_chart(self, label_counts: Counter) -> Iterator[str]:
+        """Yield one runner labels usage chart bar per label combination."""
+        top = label_counts.most_common(10)
+        if not top:
+            return
+        scale = 100.0 / top[0][1]
+        
+        for labels, count in top:
+            # Truncate long label strings for display
+            display_labels = labels if len(labels) <= 30 else labels[:27] + "..."
+            yield BAR_ITEM_HTML.format(
+                name=display_labels, count=count, job_text=JOB_WORDS.get(count, "jobs"), width_percent=count * scale
+            )
     
     def _generate_table_header_html(self, is_grouped: bool) -> str:
         """Generate HTML for table header based on data type."""
@@ -1073,11 +1969,11 @@ class ReportGenerator:
             return """
                             <th>Group</th>
                             <th>Group Type</th>
-                            <th>Total Jobs</th>
-                            <th>Successful</th>
-                            <th>Failed</th>
-                            <th>Success Rate</th>
-                            <th>Avg Duration</th>"""
+                            <th data-sort-type="number">Total Jobs</th>
+                            <th data-sort-type="number">Successful</th>
+                            <th data-sort-type="number">Failed</th>
+                            <th data-sort-type="number">Success Rate</th>
+                            <th data-sort-type="number">Avg Duration</th>"""
         else:
             return """
                             <th>Repository</th>
@@ -1086,93 +1982,114 @@ class ReportGenerator:
                             <th>Runner Labels</th>
                             <th>Runner Type</th>
                             <th>Status</th>
-                            <th>Duration</th>
-                            <th>Run Date</th>"""
+                            <th data-sort-type="number">Duration</th>
+                            <th data-sort-type="date">Run Date</th>"""
     
-    def _generate_jobs_table_html(self, data: List[Dict], is_grouped: bool = False) -> str:
-        """Generate HTML for jobs table."""
-        html = ""
+    def _table_rows_json(self, data: List[Union[JobRow, GroupRow]], is_grouped: bool = False) -> str:
+        """
+        Serialize the table rows, largest groups or most recent jobs first, for
+        rendering in the browser.
+        
+        Args:
+            data: List of job rows or group rows
+            is_grouped: Whether data holds group rows
+            
+        Returns:
+            JSON text that is safe to embed in a <script> element
+        """
+        rows: List[List[Any]] = []
+        append = rows.append
         
         if is_grouped:
-            # Generate grouped data table
-            for item in sorted(data, key=lambda x: x.get('Total Jobs', 0), reverse=True):
-                success_rate = item.get('Success Rate', '0%')
-                rate_class = 'badge-success' if float(success_rate.rstrip('%')) > 80 else 'badge-failure' if float(success_rate.rstrip('%')) < 50 else 'badge-in-progress'
-                
-                html += f"""
-                        <tr>
-                            <td><strong>{item.get('Group', 'Unknown')}</strong></td>
-                            <td>{item.get('Group Type', 'Unknown')}</td>
-                            <td>{item.get('Total Jobs', 0)}</td>
-                            <td>{item.get('Successful Jobs', 0)}</td>
-                            <td>{item.get('Failed Jobs', 0)}</td>
-                            <td><span class="badge {rate_class}">{success_rate}</span></td>
-                            <td>{item.get('Average Duration', 'unknown')}</td>
-                        </tr>"""
+            for item in sorted(data, key=attrgetter('total_jobs'), reverse=True):
+                success_rate = item.success_rate
+                pct = float(success_rate[:-1] if success_rate.endswith('%') else success_rate)
+                if pct > 80:
+                    rate_class = 'badge-success'
+                elif pct < 50:
+                    rate_class = 'badge-failure'
+                else:
+                    rate_class = 'badge-in-progress'
+                average_seconds = item.average_duration_seconds
+                append([
+                    item.group, item.group_type, item.total_jobs, item.successful_jobs, item.failed_jobs,
+                    success_rate, rate_class, pct, item.average_duration,
+                    -1 if average_seconds is None else average_seconds
+                ])
         else:
-            # Generate detailed job data table
-            sorted_data = sorted(data, key=lambda x: x.get('Run Date', ''), reverse=True)
-            
-            for item in sorted_data:
-                status_class = self._get_status_class(item.get('Job Status', 'unknown'))
-                runner_type = item.get('Runner Type', 'Unknown')
-                cost_category = item.get('Cost Category', 'Standard')
-                
-                html += f"""
-                        <tr>
-                            <td><strong>{item.get('Repo', 'Unknown')}</strong></td>
-                            <td>{item.get('Workflow Name', 'Unknown')}</td>
-                            <td>{item.get('Job Name', 'Unknown')}</td>
-                            <td><span class="badge badge-default">{item.get('Runner Labels', 'unknown')}</span></td>
-                            <td><span class="badge badge-default" title="{cost_category}">{runner_type}</span></td>
-                            <td><span class="badge {status_class}">{item.get('Job Status', 'unknown')}</span></td>
-                            <td>{item.get('Duration', 'unknown')}</td>
-                            <td>{item.get('Run Date', 'unknown')}</td>
-                        </tr>"""
-        
-        return html
+            # Bind the per-row helpers once; this loop runs for every job
+            status_class = self._get_status_class
+            format_duration = _format_duration
+            for item in sorted(data, key=lambda x: x.run_date or '', reverse=True):
+                job_status = item.job_status
+                duration_seconds = item.duration_seconds
+                append([
+                    item.repo, item.workflow_name, item.job_name, item.runner_labels, item.runner_type,
+                    item.cost_category, job_status, status_class(job_status), format_duration(duration_seconds),
+                    -1 if duration_seconds is None else duration_seconds, item.run_date or ''
+                ])
+        
+        # "</script>" inside a string value must not end the data element
+        return json_dumps({'grouped': is_grouped, 'rows': rows}).replace('<', '\\u003c')
     
     def _get_status_class(self, status: str) -> str:
         """Get CSS class for job status badge."""
-        status_map = {
-            'completed': 'badge-success',
-            'success': 'badge-success',
-            'failure': 'badge-failure',
-            'cancelled': 'badge-failure',
-            'in_progress': 'badge-in-progress',
-            'queued': 'badge-in-progress'
-        }
-        return status_map.get(status.lower(), 'badge-default')
+        # The API reports statuses in lowercase, so the lowercasing fallback is rarely needed
+        status_class = STATUS_BADGE_CLASSES.get(status)
+        if status_class is not None:
+            return status_class
+        return STATUS_BADGE_CLASSES.get(status.lower(), 'badge-default')
 
-    def generate_github_summary(self, data: List[Dict[str, Any]]) -> str:
+    def generate_github_summary(self, data: List[Union[JobRow, GroupRow]]) -> None:
+        """
+        Append the runner usage summary to the GitHub Actions step summary.
+        
+        The summary is written section by section as it is produced; outside
+        GitHub Actions (no GITHUB_STEP_SUMMARY) nothing is generated.
+        
+        Args:
+            data: List of runner usage data
+        """
+        github_step_summary = os.environ.get('GITHUB_STEP_SUMMARY')
+        if not github_step_summary:
+            self.logger.debug("GitHub Actions summary not available (not running in GitHub Actions)")
+            return
+        
+        try:
+            # Step summaries are appended to, like `>> $GITHUB_STEP_SUMMARY` in a shell step
+            with open(github_step_summary, 'a', encoding='utf-8') as f:
+                f.writelines(self._iter_summary(data))
+            self.logger.info("GitHub Actions summary updated")
+        except Exception as e:
+            self.logger.error(f"Failed to write GitHub Actions summary: {e}")
+    
+    def _iter_summary(self, data: List[Union[JobRow, GroupRow]]) -> Iterator[str]:
         """
-        Generate GitHub Actions step summary.
+        Yield the step summary markdown in consecutive pieces.
         
         Args:
             data: List of runner usage data
             
-        Returns:
-            Summary markdown string
+        Yields:
+            Markdown fragments of the summary
         """
+        org = self.org_name
+        report_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')
+        
         if not data:
             self.logger.warning("No data for GitHub summary")
-            summary = "# 🏃‍♂️ Runner Usage Report\n\n**No runner usage data found.**\n"
+            yield "# 🏃‍♂️ Runner Usage Report\n\n**No runner usage data found.**\n"
         else:
-            total_jobs = len(data)
-            unique_repos = len(set(item['Repo'] for item in data))
-            unique_workflows = len(set(item['Workflow File'] for item in data))
-            
-            repo_counts = Counter(item['Repo'] for item in data)
-            status_counts = Counter(item['Job Status'] for item in data)
-            label_counts = Counter(item['Runner Labels'] for item in data)
+            (total_jobs, unique_repos, unique_workflows,
+             repo_counts, status_counts, label_counts, is_grouped) = self._summarize(data)
             
-            summary = f"""# 🏃‍♂️ Runner Usage Report
+            yield f"""# 🏃‍♂️ Runner Usage Report
 
 ## 📊 Summary Statistics
 - **Total Jobs**: {total_jobs}
 - **Repositories Analyzed**: {unique_repos}
 - **Unique Workflow Files**: {unique_workflows}
-- **Organization**: {self.org_name}
+- **Organization**: {org}
 - **Successful Jobs**: {status_counts.get('completed', 0)}
 - **Failed Jobs**: {status_counts.get('failure', 0)}
 
@@ -1180,41 +2097,38 @@ class ReportGenerator:
 """
             
             for repo, count in repo_counts.most_common(5):
-                summary += f"- **{repo}**: {count} jobs\n"
+                yield f"- **{repo}**: {count} jobs\n"
             
-            summary += f"""
+            yield """
 ## 🏃‍♂️ Top Runner Labels
 """
             
             for labels, count in label_counts.most_common(5):
-                summary += f"- **{labels}**: {count} jobs\n"
+                yield f"- **{labels}**: {count} jobs\n"
             
-            summary += f"""
+            # heapq.nlargest picks the top rows without sorting all of them
+            if is_grouped:
+                yield """
+## 📋 Largest Groups
+| Group | Total Jobs | Successful | Failed | Success Rate | Avg Duration |
+|-------|------------|------------|--------|--------------|--------------|
+"""
+                
+                # Show the 10 largest groups
+                for item in heapq.nlargest(10, data, key=attrgetter('total_jobs')):
+                    yield f"| {item.group} | {item.total_jobs} | {item.successful_jobs} | {item.failed_jobs} | {item.success_rate} | {item.average_duration} |\n"
+            else:
+                yield """
 ## 📋 Recent Jobs
 | Repository | Workflow | Job Name | Runner Labels | Status | Date |
 |------------|----------|----------|---------------|--------|------|
 """
-            
-            # Show last 10 jobs
-            sorted_data = sorted(data, key=lambda x: x['Run Date'], reverse=True)[:10]
-            for item in sorted_data:
-                summary += f"| {item['Repo']} | {item['Workflow Name']} | {item['Job Name']} | {item['Runner Labels']} | {item['Job Status']} | {item['Run Date']} |\n"
-        
-        summary += f"\n*Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}*"
-        
-        # Write to GitHub Actions summary
-        github_step_summary = os.environ.get('GITHUB_STEP_SUMMARY')
-        if github_step_summary:
-            try:
-                with open(github_step_summary, 'w', encoding='utf-8') as f:
-                    f.write(summary)
-                self.logger.info("GitHub Actions summary updated")
-            except Exception as e:
-                self.logger.error(f"Failed to write GitHub Actions summary: {e}")
-        else:
-            self.logger.debug("GitHub Actions summary not available (not running in GitHub Actions)")
+                
+                # Show last 10 jobs
+                for item in heapq.nlargest(10, data, key=lambda x: x.run_date or ''):
+                    yield f"| {item.repo} | {item.workflow_name} | {item.job_name} | {item.runner_labels} | {item.job_status} | {item.run_date} |\n"
         
-        return summary
+        yield f"\n*Report generated on {report_time}*"
 
 
 def main():
@@ -1228,6 +2142,14 @@ def main():
         group_by = os.environ.get('GROUP_BY', 'none').lower()
         status_filter = os.environ.get('STATUS_FILTER')
         repo_filter = os.environ.get('REPO_FILTER')
+        event_filter = os.environ.get('EVENT_FILTER')
+        actor_filter = os.environ.get('ACTOR_FILTER')
+        max_concurrency = int(os.environ.get('MAX_CONCURRENCY', '16'))
+        cache_path = os.environ.get('CACHE_PATH')
+        cache_max_age_days = int(os.environ.get('CACHE_MAX_AGE_DAYS', '7'))
+        skip_conclusions = os.environ.get('SKIP_CONCLUSIONS')
+        if skip_conclusions is not None:
+            skip_conclusions = [c.strip().lower() for c in skip_conclusions.split(',') if c.strip()]
         
         if not github_token:
             raise ValueError("GITHUB_TOKEN environment variable is required")
@@ -1235,18 +2157,31 @@ def main():
             raise ValueError("ORG_NAME environment variable is required")
         
         # Initialize analyzer and report generator
-        analyzer = RunnerUsageAnalyzer(github_token, org_name)
+        analyzer = RunnerUsageAnalyzer(github_token, org_name, max_concurrency, cache_path, cache_max_age_days)
         report_generator = ReportGenerator(org_name)
         
         # Analyze runner usage
         print("🔍 Analyzing runner usage...")
-        usage_data = analyzer.analyze_runner_usage(target_label, days_back, group_by, status_filter, repo_filter)
+        try:
+            usage_data = analyzer.analyze_runner_usage(
+                target_label, days_back, group_by, status_filter, repo_filter, event_filter, actor_filter,
+                skip_conclusions
+            )
+        finally:
+            # The API is not used again, so release the cache and connections
+            analyzer.close()
         
         # Generate reports
         print("📊 Generating reports...")
-        report_generator.export_to_csv(usage_data)
-        report_generator.generate_html_report(usage_data)
-        report_generator.generate_github_summary(usage_data)
+        # The reports only read usage_data, so they are written concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            report_futures = [
+                executor.submit(report_generator.export_to_csv, usage_data, repo_meta=analyzer.repo_meta),
+                executor.submit(report_generator.generate_html_report, usage_data),
+                executor.submit(report_generator.generate_github_summary, usage_data)
+            ]
+            for future in report_futures:
+                future.result()
         
         print("✅ Analysis complete!")
         